@@ -26,7 +26,9 @@ DEFAULT_CONFIG = {
     "llm_model_filename": "qwen2-0.5b-instruct-q4_0.gguf", # For GGUF model download
     "llm_model_path": os.path.join(MODELS_DIR, "qwen2-0.5b-instruct-q4_0.gguf").replace("\\", "/"),
     "ocr_language": "eng",
-    "log_level": "INFO"
+    "log_level": "INFO",
+    "reply_max_tokens": 64, # Reply tuning, applied live
+    "reply_temperature": 0.7
     # "vulkan_offload": True, # Removed, covered by llm_processing_method and specific paths
 }
 
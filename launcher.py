@@ -1,7 +1,33 @@
 import time
+LAUNCH_START = time.perf_counter() # Taken before any other import, for the startup profile
+
+import argparse
 import os
 import sys
 
+# Only light modules are imported up front; heavy dependencies (pyautogui, pytesseract,
+# Pillow, NumPy, huggingface_hub) are LazyModules inside the scripts and are
+# loaded by the background warm-up or on first use.
+from scripts import utilities
+from scripts import temporary
+configure = utilities.timed_import("scripts.configure")
+interface = utilities.timed_import("scripts.interface")
+controller = utilities.timed_import("scripts.controller")
+detection = utilities.timed_import("scripts.detection")
+models = utilities.timed_import("scripts.models")
+
+# Cold startup to menu must stay under this; checked by --profile-startup
+STARTUP_BUDGET_SECONDS = 1.0
+WARM_UP_JOIN_TIMEOUT_SECONDS = 60
+
+WARM_UP_STEPS = [
+    ("init scripts.detection", detection.warm_up),
+    ("init scripts.models", models.warm_up),
+    ("init scripts.controller", controller.warm_up),
+]
+# Not run by --profile-startup, so profiling does not depend on a model binary or wait on a model load
+LLAMA_BOX_WARM_UP_STEP = ("init llama-box", models.start_llama_box)
+
 # Helper to get the correct Python executable from the venv
 def get_venv_python_executable(venv_dir):
     if sys.platform == "win32":
@@ -9,30 +35,58 @@ def get_venv_python_executable(venv_dir):
     else:
         return os.path.join(venv_dir, "bin", "python")
 
-if __name__ == "__main__":
-    print("Launcher script!")
-    print("This is the main entry point for SecondLlama.")
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="SecondLlama launcher.")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Show the menu once, wait for warm-up (without starting llama-box), print per-module "
+                             "import/init times and exit. "
+                             "Exits with code 1 if startup to menu exceeds the budget.")
+    parser.add_argument("--startup-budget", type=float, default=STARTUP_BUDGET_SECONDS,
+                        help=f"Startup-to-menu budget in seconds (default: {STARTUP_BUDGET_SECONDS}).")
+    return parser.parse_args()
 
-    # In a real scenario, this launcher might activate a venv
-    # and then run the main application script using the venv's Python.
-    # For now, it's just a placeholder.
-    
-    # Example: Check if we are in a venv, if not, one might try to re-launch using the venv python
-    # This is complex and usually handled by a batch/shell script.
-    # For this python launcher, we'll assume it's ALREADY running in the correct environment (e.g. venv activated by a .bat file)
-    # or the necessary packages are globally available (not recommended for production).
+def run_menu():
+    """Main menu loop. Reads temporary.config each time, as it may be reloaded in the background."""
+    while True:
+        interface.display_main_menu(temporary.config)
+        choice = input("Enter your choice (1, 2, or 3): ").strip()
+        if choice == "1":
+            print("Chat monitoring is not implemented yet.")
+        elif choice == "2":
+            interface.display_settings(temporary.config)
+        elif choice == "3":
+            break
+        else:
+            print("Invalid choice. Please try again.")
 
-    print(f"Running with Python: {sys.executable}")
-    print(f"Python version: {sys.version}")
-    print(f"Current working directory: {os.getcwd()}")
-
-    print("\nActual application logic will be implemented here or called from here later.")
-    print("For now, this script just demonstrates it can be launched.")
+def main():
+    args = parse_arguments()
+    temporary.config = utilities.timed_call("init scripts.configure", configure.load_config)
+    if args.profile_startup:
+        utilities.start_background_warm_up(WARM_UP_STEPS)
+    else:
+        utilities.start_background_warm_up(WARM_UP_STEPS + [LLAMA_BOX_WARM_UP_STEP])
 
-    # Simulate some work or app initialization
-    print("Pausing for 5 seconds before exiting...")
-    time.sleep(5)
+    if args.profile_startup:
+        interface.display_main_menu(temporary.config)
+        time_to_menu = time.perf_counter() - LAUNCH_START
+        temporary.warm_up_thread.join(WARM_UP_JOIN_TIMEOUT_SECONDS)
+        interface.display_startup_report(temporary.startup_timings, temporary.lazy_modules,
+                                         time_to_menu, args.startup_budget)
+        return 0 if time_to_menu <= args.startup_budget else 1
 
+    # Only model changes restart llama-box; everything else applies live via temporary.config
+    config_watcher = configure.ConfigWatcher()
+    config_watcher.register("llama-box", models.restart_llama_box)
+    config_watcher.start()
+    try:
+        run_menu()
+    finally:
+        # Stopping llama-box first cancels any restart the watcher is waiting on
+        models.stop_llama_box()
+        config_watcher.stop()
     print("Launcher finished.")
-    # No explicit exit() needed, script will exit after last line
-```
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
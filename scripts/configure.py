@@ -1,4 +1,284 @@
 # Script: ./scripts/configure.py - Handles application configuration loading and management.
 
+import dataclasses
+import json
+import os
+import threading
+
+from scripts import models
+from scripts import temporary
+
+DATA_DIR = "./data"
+CONFIG_FILE_PATH = os.path.join(DATA_DIR, "persistent.json")
+CONFIG_POLL_INTERVAL_SECONDS = 2.0
+CONFIG_WATCHER_STOP_TIMEOUT_SECONDS = 15
+
+PROCESSING_METHODS = ("vulkan", "cpu")
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+# --- Config Object ---
+
+@dataclasses.dataclass(frozen=True)
+class Config:
+    """Typed, validated view of persistent.json. Defaults mirror installer.DEFAULT_CONFIG."""
+    username: str = "User"
+    llm_engine: str = "llama-box"
+    llm_processing_method: str = "vulkan"
+    llama_box_vulkan_path: str = "./data/llama-box/vulkan/llama-box.exe"
+    llama_box_cpu_path: str = "./data/llama-box/avx2/llama-box.exe"
+    llm_model_repo_id: str = "Qwen/Qwen2-0.5B-Instruct-GGUF"
+    llm_model_filename: str = "qwen2-0.5b-instruct-q4_0.gguf"
+    llm_model_path: str = "./data/models/qwen2-0.5b-instruct-q4_0.gguf"
+    ocr_language: str = "eng"
+    log_level: str = "INFO"
+    reply_max_tokens: int = 64
+    reply_temperature: float = 0.7
+
+    @classmethod
+    def from_dict(cls, data):
+        """Builds a Config from a dict, raising ValueError on bad types or values. Unknown keys are ignored."""
+        values, errors = check_fields(data)
+        if errors:
+            raise ValueError("; ".join(errors))
+        return cls(**values)
+
+    @property
+    def llama_box_path(self):
+        """The llama-box executable for the selected processing method."""
+        if self.llm_processing_method == "vulkan":
+            return self.llama_box_vulkan_path
+        return self.llama_box_cpu_path
+
+    def to_dict(self):
+        return dataclasses.asdict(self)
+
+# Value checks beyond the type check, as (predicate, message) per field
+FIELD_CHECKS = {
+    "username": (lambda value: bool(value.strip()), "must not be empty"),
+    "llm_processing_method": (lambda value: value in PROCESSING_METHODS, f"must be one of {PROCESSING_METHODS}"),
+    "log_level": (lambda value: value in LOG_LEVELS, f"must be one of {LOG_LEVELS}"),
+    "reply_max_tokens": (lambda value: value > 0, "must be positive"),
+    "reply_temperature": (lambda value: 0.0 <= value <= 2.0, "must be between 0.0 and 2.0"),
+}
+
+def check_fields(data):
+    """Type- and value-checks the known keys of data. Returns (valid_values, error_messages)."""
+    values = {}
+    errors = []
+    for field in dataclasses.fields(Config):
+        if field.name not in data:
+            continue
+        value = data[field.name]
+        if field.type is float and type(value) is int:
+            value = float(value)
+        if type(value) is not field.type:
+            errors.append(f"'{field.name}' must be {field.type.__name__}, got {type(value).__name__}")
+            continue
+        if field.name in FIELD_CHECKS:
+            predicate, message = FIELD_CHECKS[field.name]
+            if not predicate(value):
+                errors.append(f"'{field.name}' {message}, got {value!r}")
+                continue
+        values[field.name] = value
+    return values, errors
+
+# --- Loading ---
+
+def read_config_data(config_path=CONFIG_FILE_PATH):
+    """Reads persistent.json as a dict. Raises OSError or ValueError (incl. JSONDecodeError)."""
+    with open(config_path, 'r') as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError("top level must be a JSON object")
+    return data
+
+def read_config(config_path=CONFIG_FILE_PATH):
+    """Reads and strictly validates persistent.json. Raises OSError or ValueError."""
+    return Config.from_dict(read_config_data(config_path))
+
+def load_config(config_path=CONFIG_FILE_PATH):
+    """Loads persistent.json at startup.
+
+    Invalid fields fall back to their defaults (with a warning) while the rest of the
+    file is kept. Falls back to all defaults only if the file is missing or unreadable.
+    """
+    if not os.path.exists(config_path):
+        print(f"Warning: Persistent configuration not found at {os.path.abspath(config_path)}. Using defaults.")
+        return Config()
+    try:
+        data = read_config_data(config_path)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: Could not load persistent configuration {config_path}: {e}. Using defaults.")
+        return Config()
+    values, errors = check_fields(data)
+    for error in errors:
+        print(f"ERROR: Invalid setting in {config_path}: {error}. Using the default for this setting.")
+    return Config(**values)
+
+# --- Change Detection ---
+
+# Which subsystem each setting affects. "live" settings are read from
+# temporary.config at the point of use, so swapping the config applies them.
+# "deferred" settings (including the llama-box executable paths) are only read
+# when llama-box is next (re)started. Only "llama-box" settings trigger a restart.
+FIELD_SUBSYSTEMS = {
+    "username": "live",
+    "ocr_language": "live",
+    "log_level": "live",
+    "reply_max_tokens": "live",
+    "reply_temperature": "live",
+    "llm_processing_method": "llama-box",
+    "llm_model_path": "llama-box",
+    "llm_engine": "deferred",
+    "llama_box_vulkan_path": "deferred",
+    "llama_box_cpu_path": "deferred",
+    "llm_model_repo_id": "deferred",
+    "llm_model_filename": "deferred",
+}
+
+def diff_configs(old_config, new_config):
+    """Returns {field_name: (old_value, new_value)} for every setting that changed."""
+    old_values = old_config.to_dict()
+    new_values = new_config.to_dict()
+    return {name: (old_values[name], new_values[name])
+            for name in old_values if old_values[name] != new_values[name]}
+
+def affected_subsystems(changes):
+    """Maps changed field names to the set of subsystems that need to act on them."""
+    return {FIELD_SUBSYSTEMS[name] for name in changes}
+
+class ConfigWatcher:
+    """Watches persistent.json by mtime and applies changes to temporary.config.
+
+    Handlers registered for a subsystem are called as handler(old_config, new_config, changes)
+    only when a change affects that subsystem, so e.g. a username edit never restarts llama-box.
+    Settings without handlers are applied on the polling thread straight away. Handlers run
+    on a separate worker thread, which only keeps the latest pending config per subsystem, so
+    a slow model switch never holds up live settings. A subsystem's settings reach
+    temporary.config only after its handlers succeed.
+    """
+
+    def __init__(self, config_path=CONFIG_FILE_PATH, poll_interval=CONFIG_POLL_INTERVAL_SECONDS):
+        self.config_path = config_path
+        self.poll_interval = poll_interval
+        self.handlers = {}
+        self._last_stamp = self._file_stamp()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._worker_thread = None
+        # Guards read-modify-write of temporary.config between the polling and worker threads
+        self._config_lock = threading.Lock()
+        # subsystem -> latest Config whose settings for that subsystem are waiting on its handlers
+        self._pending_configs = {}
+        # subsystem -> Config most recently queued for it; dropped again if its handlers fail
+        self._requested_configs = {}
+        self._work_ready = threading.Condition()
+
+    def register(self, subsystem, handler):
+        self.handlers.setdefault(subsystem, []).append(handler)
+
+    def _file_stamp(self):
+        try:
+            stat = os.stat(self.config_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _apply_fields(self, changes):
+        """Commits the new values in changes to temporary.config."""
+        with self._config_lock:
+            temporary.config = dataclasses.replace(temporary.config, **{name: new for name, (old, new) in changes.items()})
+
+    def check_for_changes(self):
+        """Reloads persistent.json if it changed since the last check.
+
+        Applies settings without handlers and queues the rest for the worker thread.
+        Returns the changes applied immediately.
+        """
+        stamp = self._file_stamp()
+        if stamp is None or stamp == self._last_stamp:
+            return {}
+        self._last_stamp = stamp
+        try:
+            new_config = read_config(self.config_path)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: Ignoring invalid persistent configuration change: {e}. Keeping current settings.")
+            return {}
+        with self._config_lock:
+            changes = diff_configs(temporary.config, new_config)
+        with self._work_ready:
+            # Skip handled settings that are already queued or being applied with the same value
+            changes = {name: change for name, change in changes.items()
+                       if FIELD_SUBSYSTEMS[name] not in self._requested_configs
+                       or getattr(self._requested_configs[FIELD_SUBSYSTEMS[name]], name) != change[1]}
+        if not changes:
+            return {}
+        subsystems = affected_subsystems(changes)
+        print(f"Settings changed: {', '.join(sorted(changes))} (affects: {', '.join(sorted(subsystems))})")
+        immediate_changes = {name: change for name, change in changes.items()
+                             if FIELD_SUBSYSTEMS[name] not in self.handlers}
+        if immediate_changes:
+            self._apply_fields(immediate_changes)
+        handled_subsystems = subsystems & self.handlers.keys()
+        if handled_subsystems:
+            with self._work_ready:
+                for subsystem in handled_subsystems:
+                    self._pending_configs[subsystem] = new_config
+                    self._requested_configs[subsystem] = new_config
+                self._work_ready.notify()
+        return immediate_changes
+
+    def _run_handlers(self, subsystem, new_config):
+        """Runs a subsystem's handlers for new_config and commits its settings if they all succeed."""
+        with self._config_lock:
+            old_config = temporary.config
+        changes = {name: change for name, change in diff_configs(old_config, new_config).items()
+                   if FIELD_SUBSYSTEMS[name] == subsystem}
+        if not changes:
+            return
+        target_config = dataclasses.replace(old_config, **{name: new for name, (old, new) in changes.items()})
+        try:
+            for handler in self.handlers[subsystem]:
+                handler(old_config, target_config, changes)
+        except Exception as e:
+            with self._work_ready:
+                # Forget the request (unless superseded) so editing the file again retries it
+                if self._requested_configs.get(subsystem) is new_config:
+                    del self._requested_configs[subsystem]
+            if not isinstance(e, models.LlamaBoxCancelled):
+                print(f"ERROR: Failed to apply settings change to {subsystem}: {e}. Keeping previous {subsystem} settings.")
+            return
+        self._apply_fields(changes)
+
+    def _work(self):
+        while True:
+            with self._work_ready:
+                while not self._pending_configs and not self._stop_event.is_set():
+                    self._work_ready.wait()
+                if self._stop_event.is_set():
+                    return
+                subsystem, new_config = self._pending_configs.popitem()
+            self._run_handlers(subsystem, new_config)
+
+    def start(self):
+        """Polls for changes on a daemon thread, with handlers on a second daemon thread."""
+        def poll():
+            while not self._stop_event.wait(self.poll_interval):
+                self.check_for_changes()
+
+        self._worker_thread = threading.Thread(target=self._work, name="config-handlers", daemon=True)
+        self._worker_thread.start()
+        self._thread = threading.Thread(target=poll, name="config-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stops polling and the handler worker. Call models.stop_llama_box() first so a restart in progress is cancelled."""
+        with self._work_ready:
+            self._stop_event.set()
+            self._work_ready.notify()
+        for thread in (self._thread, self._worker_thread):
+            if thread is not None:
+                thread.join(CONFIG_WATCHER_STOP_TIMEOUT_SECONDS)
+
 if __name__ == '__main__':
     print("This is the configuration script. It will manage settings from config.json.")
@@ -1,4 +1,14 @@
 # Script: ./scripts/controller.py - Controls actions made by the AI in SecondLife.
 
+from scripts.utilities import LazyModule
+
+# pyautogui probes the display at import time, so it is only loaded on first use
+pyautogui = LazyModule("pyautogui")
+
+def warm_up():
+    """Loads pyautogui and probes the screen ahead of first use."""
+    pyautogui.FAILSAFE = True
+    pyautogui.size()
+
 if __name__ == '__main__':
     print("This is the controller script. It will manage AI actions in SecondLife.")
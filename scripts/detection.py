@@ -1,4 +1,19 @@
 # Script: ./scripts/detection.py - Handles detection of text/images in SecondLife.
 
+from scripts.utilities import LazyModule
+
+# Heavy capture/OCR dependencies, loaded on first use
+np = LazyModule("numpy")
+Image = LazyModule("PIL.Image")
+ImageGrab = LazyModule("PIL.ImageGrab")
+pytesseract = LazyModule("pytesseract")
+
+def warm_up():
+    """Loads the capture/OCR stack ahead of the first screen grab."""
+    np.load()
+    Image.load()
+    ImageGrab.load()
+    pytesseract.load()
+
 if __name__ == '__main__':
     print("This is the detection script. It will handle text/image detection in SecondLife.")
@@ -1,4 +1,37 @@
 # Script: ./scripts/interface.py - Manages the application's command-line interface, menus, and text feedback.
 
+def display_main_menu(config):
+    """Prints the main menu."""
+    print("\n" + "=" * 80)
+    print("SecondLlama".center(80))
+    print("=" * 80)
+    print(f"Username: {config.username}")
+    print(f"Processing method: {config.llm_processing_method}")
+    print(f"Model: {config.llm_model_path}")
+    print("-" * 80)
+    print("[1] Start SecondLlama")
+    print("[2] Show Settings")
+    print("[3] Exit")
+    print("=" * 80)
+
+def display_settings(config):
+    """Prints the current settings."""
+    print("\n--- Current Settings ---")
+    for key, value in config.to_dict().items():
+        print(f"{key}: {value}")
+
+def display_startup_report(timings, lazy_modules, time_to_menu, budget_seconds):
+    """Prints per-module import/init times, lazy modules still not loaded, and whether startup to menu was within budget."""
+    print("\n--- Startup Profile ---")
+    for entry in timings:
+        status = "" if entry["status"] == "ok" else f"  ({entry['status']})"
+        print(f"{entry['seconds'] * 1000:10.1f} ms  {entry['label']}{status}")
+    not_loaded = [module.module_name for module in lazy_modules if not module.is_loaded]
+    if not_loaded:
+        print(f"Not loaded: {', '.join(not_loaded)}")
+    print("-" * 80)
+    verdict = "OK" if time_to_menu <= budget_seconds else "OVER BUDGET"
+    print(f"Startup to menu: {time_to_menu * 1000:.1f} ms (budget {budget_seconds * 1000:.0f} ms) - {verdict}")
+
 if __name__ == '__main__':
     print("This is the application interface script. It will handle CLI menus and text feedback.")
@@ -1,4 +1,164 @@
 # Script: ./scripts/models.py - Handles model-related logic and llama-box interactions.
 
+import os
+import subprocess
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from scripts import temporary
+from scripts.utilities import LazyModule
+
+# Only needed for model downloads/lookups, loaded on first use
+huggingface_hub = LazyModule("huggingface_hub")
+
+LLAMA_BOX_HOST = "127.0.0.1"
+# Two ports so a replacement server can warm up while the current one keeps serving
+LLAMA_BOX_PORTS = (8080, 8081)
+LLAMA_BOX_READY_TIMEOUT_SECONDS = 120
+LLAMA_BOX_STOP_TIMEOUT_SECONDS = 10
+LLAMA_BOX_POLL_INTERVAL_SECONDS = 0.25
+
+# Serialises start/restart/stop across the warm-up, config-watcher and main threads
+_llama_box_lock = threading.Lock()
+# Set by stop_llama_box; cancels any load in progress and blocks further starts
+_llama_box_shutdown = threading.Event()
+
+class LlamaBoxCancelled(Exception):
+    """Raised when a llama-box start or restart is cancelled by stop_llama_box."""
+
+# --- llama-box Server ---
+
+class LlamaBoxServer:
+    """A llama-box process serving one model on one port."""
+
+    def __init__(self, executable_path, model_path, processing_method, port):
+        self.executable_path = executable_path
+        self.model_path = model_path
+        self.processing_method = processing_method
+        self.port = port
+        self.process = None
+
+    @property
+    def base_url(self):
+        return f"http://{LLAMA_BOX_HOST}:{self.port}"
+
+    def build_command(self):
+        gpu_layers = "99" if self.processing_method == "vulkan" else "0"
+        return [self.executable_path, "-m", self.model_path,
+                "--host", LLAMA_BOX_HOST, "--port", str(self.port), "-ngl", gpu_layers]
+
+    def start(self):
+        if not os.path.exists(self.executable_path):
+            raise FileNotFoundError(f"llama-box not found at {os.path.abspath(self.executable_path)}")
+        if not os.path.exists(self.model_path):
+            raise FileNotFoundError(f"Model not found at {os.path.abspath(self.model_path)}")
+        self.process = subprocess.Popen(self.build_command(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def is_ready(self):
+        try:
+            with urllib.request.urlopen(f"{self.base_url}/health", timeout=1) as response:
+                return response.status == 200
+        except (urllib.error.URLError, OSError):
+            return False
+
+    def wait_until_ready(self, timeout=LLAMA_BOX_READY_TIMEOUT_SECONDS, cancel_event=None):
+        """Blocks until the model is loaded and /health answers.
+
+        Raises RuntimeError on exit or timeout, LlamaBoxCancelled if cancel_event is set.
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if cancel_event is not None and cancel_event.is_set():
+                raise LlamaBoxCancelled(f"llama-box start cancelled while loading {self.model_path}")
+            if self.process.poll() is not None:
+                raise RuntimeError(f"llama-box exited with code {self.process.returncode} while loading {self.model_path}")
+            if self.is_ready():
+                return
+            if cancel_event is not None:
+                cancel_event.wait(LLAMA_BOX_POLL_INTERVAL_SECONDS)
+            else:
+                time.sleep(LLAMA_BOX_POLL_INTERVAL_SECONDS)
+        raise RuntimeError(f"llama-box did not become ready within {timeout} seconds")
+
+    def stop(self):
+        if self.process is None or self.process.poll() is not None:
+            return
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=LLAMA_BOX_STOP_TIMEOUT_SECONDS)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+def create_server(config, port):
+    return LlamaBoxServer(config.llama_box_path, config.llm_model_path, config.llm_processing_method, port)
+
+def _launch_and_wait(server):
+    """Starts server as temporary.llama_box_pending_server and waits for it. Caller holds _llama_box_lock."""
+    if _llama_box_shutdown.is_set():
+        raise LlamaBoxCancelled("llama-box is shutting down")
+    server.start()
+    temporary.llama_box_pending_server = server
+    try:
+        server.wait_until_ready(cancel_event=_llama_box_shutdown)
+    except Exception:
+        server.stop()
+        raise
+    finally:
+        temporary.llama_box_pending_server = None
+
+def start_llama_box():
+    """Starts llama-box for temporary.config and waits for the model to load."""
+    with _llama_box_lock:
+        server = create_server(temporary.config, LLAMA_BOX_PORTS[0])
+        _launch_and_wait(server)
+        temporary.llama_box_server = server
+        return server
+
+def stop_llama_box():
+    """Stops the current and any still-loading llama-box. No further starts are allowed afterwards."""
+    _llama_box_shutdown.set()
+    # A load in progress sees the event within one poll interval, stops its own process and releases the lock
+    with _llama_box_lock:
+        for server in (temporary.llama_box_pending_server, temporary.llama_box_server):
+            if server is not None:
+                server.stop()
+        temporary.llama_box_pending_server = None
+        temporary.llama_box_server = None
+
+def restart_llama_box(old_config, new_config, changes):
+    """ConfigWatcher handler: warms a server for new_config on the spare port, then switches over.
+
+    The current server keeps answering until the replacement is ready; if the
+    replacement fails to load, the current server is kept and the error is raised.
+    If no server is running (e.g. the first start failed), one is started for new_config.
+    """
+    with _llama_box_lock:
+        if _llama_box_shutdown.is_set():
+            raise LlamaBoxCancelled("llama-box is shutting down")
+        current = temporary.llama_box_server
+        if current is None:
+            server = create_server(new_config, LLAMA_BOX_PORTS[0])
+            print(f"Starting llama-box ({new_config.llm_processing_method}, {new_config.llm_model_path})...")
+            _launch_and_wait(server)
+            temporary.llama_box_server = server
+            print(f"llama-box ready on port {server.port}.")
+            return
+        if (current.processing_method, current.model_path) == (new_config.llm_processing_method, new_config.llm_model_path):
+            return
+        spare_port = LLAMA_BOX_PORTS[1] if current.port == LLAMA_BOX_PORTS[0] else LLAMA_BOX_PORTS[0]
+        replacement = create_server(new_config, spare_port)
+        print(f"Warming llama-box ({new_config.llm_processing_method}, {new_config.llm_model_path}) on port {spare_port}...")
+        _launch_and_wait(replacement)
+        temporary.llama_box_server = replacement
+        current.stop()
+        print(f"Switched to llama-box on port {spare_port}.")
+
+def warm_up():
+    """Loads the model-side dependencies ahead of first use."""
+    huggingface_hub.load()
+
 if __name__ == '__main__':
     print("This is the models script. It will manage llama-box execution and parameters.")
@@ -1,4 +1,24 @@
 # Script: ./scripts/temporary.py - Manages runtime global variables, maps, or temporary state.
 
+# --- Configuration ---
+# Active configure.Config; replaced (never mutated) by configure.ConfigWatcher on reload
+config = None
+
+# --- llama-box ---
+# Running models.LlamaBoxServer, or None
+llama_box_server = None
+# models.LlamaBoxServer that has been launched but is still loading, or None
+llama_box_pending_server = None
+
+# --- Startup / Warm-up State ---
+# Each entry is a dict: {"label": str, "seconds": float, "status": str}
+startup_timings = []
+
+# LazyModule instances created by the scripts, in creation order (see utilities.LazyModule)
+lazy_modules = []
+
+# Background warm-up thread for the capture/model stack (set by launcher.py)
+warm_up_thread = None
+
 if __name__ == '__main__':
     print("This is the temporary/shared state script.")
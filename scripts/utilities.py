@@ -1,4 +1,98 @@
 # Script: ./scripts/utilities.py - Contains common utility functions for the project.
 
+import importlib
+import threading
+import time
+
+from scripts import temporary
+
+# --- Startup Timing ---
+
+def record_timing(label, seconds, status="ok"):
+    """Records how long a startup step took, for the startup profiling report."""
+    temporary.startup_timings.append({"label": label, "seconds": seconds, "status": status})
+
+def timed_call(label, func, *args, **kwargs):
+    """Calls func, recording its duration under label. Exceptions are recorded and re-raised."""
+    start = time.perf_counter()
+    try:
+        result = func(*args, **kwargs)
+    except Exception as e:
+        record_timing(label, time.perf_counter() - start, f"failed: {e}")
+        raise
+    record_timing(label, time.perf_counter() - start)
+    return result
+
+def timed_import(module_name):
+    """Imports a module by name, recording the import time."""
+    return timed_call(f"import {module_name}", importlib.import_module, module_name)
+
+# --- Lazy Imports ---
+
+class LazyModule:
+    """Stands in for a heavy module and imports it on first attribute access.
+
+    pyautogui, pytesseract, Pillow, NumPy and huggingface_hub are slow to import
+    (pyautogui also probes the display), so the scripts hold them as LazyModule
+    objects and the menu can come up before any of them are loaded.
+    """
+
+    def __init__(self, module_name):
+        self._module_name = module_name
+        self._module = None
+        self._lock = threading.Lock()
+        temporary.lazy_modules.append(self)
+
+    @property
+    def module_name(self):
+        return self._module_name
+
+    @property
+    def is_loaded(self):
+        return self._module is not None
+
+    def load(self):
+        """Imports the real module (once, thread-safe) and returns it."""
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = timed_import(self._module_name)
+        return self._module
+
+    def __getattr__(self, name):
+        return getattr(self.load(), name)
+
+    def __setattr__(self, name, value):
+        # Module settings such as pyautogui.FAILSAFE must land on the real module
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.load(), name, value)
+
+    def __repr__(self):
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<LazyModule {self._module_name} ({state})>"
+
+# --- Background Warm-up ---
+
+def start_background_warm_up(warm_up_steps):
+    """Runs (label, func) warm-up steps on a daemon thread, timing each one.
+
+    Failures are recorded rather than raised, so a missing display or Tesseract
+    install does not take down the menu; the same error will surface again when
+    the feature is actually used.
+    """
+    def run_steps():
+        for label, func in warm_up_steps:
+            try:
+                timed_call(label, func)
+            except Exception:
+                pass
+
+    thread = threading.Thread(target=run_steps, name="warm-up", daemon=True)
+    thread.start()
+    temporary.warm_up_thread = thread
+    return thread
+
 if __name__ == '__main__':
     print("This is the utilities script. It will house various helper functions.")
@@ -0,0 +1,65 @@
+# Cold Startup Test Script for SecondLlama
+#
+# Runs `launcher.py --profile-startup` in a fresh Python process and times, from
+# outside, how long it takes for the main menu to appear. Fails if the launcher
+# exits non-zero (its own in-process budget check) or if the externally measured
+# cold startup to menu exceeds the budget.
+#
+# Usage (from the project folder, with the venv active):
+#    python startup_test.py [budget_seconds]
+# It is also collected by pytest as test_cold_startup_to_menu_within_budget.
+#
+# llama-box is not started in profile mode, so no model or binary is needed.
+
+import os
+import subprocess
+import sys
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+LAUNCHER_PATH = os.path.join(PROJECT_DIR, "launcher.py")
+STARTUP_BUDGET_SECONDS = 1.0 # Keep in step with launcher.STARTUP_BUDGET_SECONDS
+MENU_LAST_LINE = "[3] Exit"
+PROFILE_TIMEOUT_SECONDS = 120
+
+def measure_cold_startup(budget_seconds=STARTUP_BUDGET_SECONDS):
+    """Launches the profile run and returns (seconds_to_menu, return_code, output)."""
+    command = [sys.executable, "-u", LAUNCHER_PATH, "--profile-startup", "--startup-budget", str(budget_seconds)]
+    start_time = time.perf_counter()
+    process = subprocess.Popen(command, cwd=PROJECT_DIR, stdout=subprocess.PIPE,
+                               stderr=subprocess.STDOUT, text=True)
+    output_lines = []
+    seconds_to_menu = None
+    for line in process.stdout:
+        output_lines.append(line)
+        if seconds_to_menu is None and MENU_LAST_LINE in line:
+            seconds_to_menu = time.perf_counter() - start_time
+    return_code = process.wait(timeout=PROFILE_TIMEOUT_SECONDS)
+    return seconds_to_menu, return_code, "".join(output_lines)
+
+def check_cold_startup(budget_seconds=STARTUP_BUDGET_SECONDS):
+    """Asserts the profile run succeeded within budget. Returns (seconds_to_menu, output)."""
+    seconds_to_menu, return_code, output = measure_cold_startup(budget_seconds)
+    assert return_code == 0, f"launcher.py --profile-startup exited with code {return_code}:\n{output}"
+    assert seconds_to_menu is not None, f"Main menu never appeared:\n{output}"
+    assert seconds_to_menu <= budget_seconds, (
+        f"Cold startup to menu took {seconds_to_menu * 1000:.1f} ms, budget is {budget_seconds * 1000:.0f} ms:\n{output}")
+    return seconds_to_menu, output
+
+def test_cold_startup_to_menu_within_budget():
+    check_cold_startup()
+
+def main():
+    budget_seconds = float(sys.argv[1]) if len(sys.argv) > 1 else STARTUP_BUDGET_SECONDS
+    print(f"Measuring cold startup to menu (budget {budget_seconds * 1000:.0f} ms)...")
+    try:
+        seconds_to_menu, output = check_cold_startup(budget_seconds)
+    except AssertionError as e:
+        print(f"FAIL: {e}")
+        return 1
+    print(output)
+    print(f"PASS: cold startup to menu took {seconds_to_menu * 1000:.1f} ms")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())